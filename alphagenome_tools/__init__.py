@@ -17,7 +17,8 @@ from .helpers import (
     export_to_csv,
     create_comparison_table,
     monitor_api_quota,
-    APIMonitor
+    APIMonitor,
+    TokenBucket
 )
 
 from .visualization import (
@@ -41,6 +42,7 @@ __all__ = [
     'create_comparison_table',
     'monitor_api_quota',
     'APIMonitor',
+    'TokenBucket',
 
     # Visualization
     'quick_plot',
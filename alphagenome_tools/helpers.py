@@ -6,11 +6,21 @@ and API quota monitoring.
 """
 
 import os
+import sys
 import csv
+import json
+import time
+import atexit
 import logging
+import threading
+import importlib.util
+from operator import itemgetter
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Union, TYPE_CHECKING
+from typing import Iterator, List, Literal, Dict, Optional, Union, TYPE_CHECKING
+import numpy as np
 import pandas as pd
 
 # AlphaGenome imports
@@ -30,6 +40,24 @@ try:
 except ImportError:
     tqdm = None
 
+# Try to import pyarrow for faster CSV parsing and writing
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
+
+
+def _importable(name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    return importlib.util.find_spec(name) is not None
+
+
+# Optional dependencies are resolved once at import time
+_HAS_TQDM = tqdm is not None
+_HAS_PYARROW = pyarrow is not None
+_EXCEL_ENGINE = 'xlsxwriter' if _importable('xlsxwriter') else 'openpyxl'
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,6 +65,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-row results yielded by batch_predict_*(return_format='iter')
+_VariantResult = namedtuple(
+    '_VariantResult',
+    ['chromosome', 'position', 'reference', 'alternate', 'success', 'has_outputs', 'error']
+)
+_SequenceResult = namedtuple(
+    '_SequenceResult',
+    ['chromosome', 'start', 'end', 'length', 'success', 'error',
+     'mean_expression', 'max_expression', 'data_points']
+)
+
 
 class APIMonitor:
     """
@@ -45,30 +84,65 @@ class APIMonitor:
     Tracks the number of API calls made and provides warnings when approaching limits.
     """
 
-    def __init__(self, limit: int = 1000000, warning_threshold: float = 0.9):
+    def __init__(
+        self,
+        limit: int = 1000000,
+        warning_threshold: float = 0.9,
+        verbose_audit: bool = False
+    ):
         """
         Initialize API monitor.
 
         Args:
             limit: Maximum number of API calls allowed (default: 1M for free tier)
             warning_threshold: Fraction of limit at which to warn (default: 0.9)
+            verbose_audit: Also append a timestamped line to api_usage.log on
+                          every flush (default: False)
         """
         self.limit = limit
         self.warning_threshold = warning_threshold
+        self.verbose_audit = verbose_audit
         self.calls = 0
+        self.state_file = Path.home() / 'work' / 'api_usage.state'
         self.log_file = Path.home() / 'work' / 'api_usage.log'
 
+        # Usage is written every `_flush_every` API calls and at interpreter
+        # exit; the audit log file is opened lazily and kept open
+        self._fh = None
+        self._dirty = 0
+        self._flush_every = 100
+        atexit.register(self._flush)
+
         # Load previous usage if exists
         self._load_usage()
 
     def _load_usage(self):
-        """Load previous API usage from log file."""
+        """Load previous API usage from the state file (or the log file written by older versions)."""
+        if self.state_file.exists():
+            try:
+                self.calls = int(json.loads(self.state_file.read_text())['calls'])
+                return
+            except Exception as e:
+                logger.warning(f"Could not load previous usage: {e}")
+
         if self.log_file.exists():
             try:
-                with open(self.log_file, 'r') as f:
-                    last_line = f.readlines()[-1]
-                    if 'Total calls' in last_line:
-                        self.calls = int(last_line.split('Total calls:')[1].strip())
+                with open(self.log_file, 'rb') as f:
+                    f.seek(0, os.SEEK_END)
+                    size = f.tell()
+
+                    # Only the last "Total calls" line matters: read the tail of
+                    # the file, widening the window if the line isn't in it
+                    for window in (4096, 65536):
+                        f.seek(max(0, size - window))
+                        tail = f.read().decode('utf-8', errors='ignore')
+                        marker = tail.rfind('Total calls:')
+                        if marker != -1:
+                            last_line = tail[marker:].split('\n', 1)[0]
+                            self.calls = int(last_line.split('Total calls:')[1].strip())
+                            break
+                        if window >= size:
+                            break
             except Exception as e:
                 logger.warning(f"Could not load previous usage: {e}")
 
@@ -80,7 +154,7 @@ class APIMonitor:
             count: Number of API calls to add
         """
         self.calls += count
-        self._log_usage()
+        self._log_usage(count)
 
         # Check if approaching limit
         usage_fraction = self.calls / self.limit
@@ -90,12 +164,33 @@ class APIMonitor:
                 f"({usage_fraction*100:.1f}%)"
             )
 
-    def _log_usage(self):
-        """Log current API usage to file."""
+    def _log_usage(self, count: int = 1):
+        """Record `count` API calls, writing usage out every `_flush_every` calls."""
+        self._dirty += count
+        if self._dirty >= self._flush_every:
+            self._flush()
+
+    def _flush(self):
+        """Write current API usage to the state file if there are unwritten updates."""
+        if not self._dirty:
+            return
         try:
-            self.log_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.log_file, 'a') as f:
-                f.write(f"{datetime.now().isoformat()} - Total calls: {self.calls}\n")
+            now = datetime.now().isoformat()
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file and rename it over the state file, so
+            # readers never see a partially written state
+            tmp_file = self.state_file.with_name(f'{self.state_file.name}.{os.getpid()}.tmp')
+            tmp_file.write_text(json.dumps({'calls': self.calls, 'updated_at': now}))
+            os.replace(tmp_file, self.state_file)
+
+            if self.verbose_audit:
+                if self._fh is None:
+                    self._fh = open(self.log_file, 'a', buffering=8192)
+                self._fh.write(f"{now} - Total calls: {self.calls}\n")
+                self._fh.flush()
+
+            self._dirty = 0
         except Exception as e:
             logger.error(f"Could not log usage: {e}")
 
@@ -118,6 +213,61 @@ class APIMonitor:
         return f"API Usage: {self.calls:,}/{self.limit:,} calls ({remaining:,} remaining)"
 
 
+class TokenBucket:
+    """
+    Client-side token bucket rate limiter.
+
+    Tokens refill continuously at `rate_per_sec` up to `burst`; each request
+    takes one token and waits when none are left. Safe to share between threads.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate_per_sec: Sustained number of requests allowed per second
+            burst: Maximum number of requests allowed back-to-back (minimum 1)
+        """
+        if rate_per_sec <= 0:
+            raise ValueError(f"rate_per_sec must be positive, got {rate_per_sec}")
+
+        self.rate_per_sec = rate_per_sec
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_sec)
+            self._updated = now
+
+            # Reserve the token now (the balance may go negative) and sleep
+            # outside the lock until it has been refilled
+            self._tokens -= 1
+            wait = -self._tokens / self.rate_per_sec if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _intern(value, max_len: Optional[int] = None):
+    """
+    Return a shared copy of a frequently repeated string.
+
+    Chromosome names (and single-base alleles) repeat on almost every row of
+    a variant file, so interning them stores one object per distinct value
+    instead of one per row. Non-strings (e.g. missing values) and strings
+    longer than `max_len` are returned unchanged.
+    """
+    if isinstance(value, str) and (max_len is None or len(value) <= max_len):
+        return sys.intern(value)
+    return value
+
+
 # Global API monitor instance
 _api_monitor = None
 
@@ -135,11 +285,36 @@ def monitor_api_quota(limit: int = 1000000, reset: bool = False) -> APIMonitor:
     """
     global _api_monitor
     if _api_monitor is None or reset:
+        if _api_monitor is not None:
+            # Persist pending usage before the new monitor reloads it
+            _api_monitor._flush()
         _api_monitor = APIMonitor(limit=limit)
     return _api_monitor
 
 
-def load_variants_from_csv(filepath: Union[str, Path]) -> List['genome.Variant']:
+def _iter_csv_columns(filepath: Path, columns: List[str]) -> Iterator[tuple]:
+    """
+    Yield the named columns of each CSV row as a tuple of strings.
+
+    Pure-stdlib reader used when the pandas parser is not wanted. Columns are
+    looked up once in the header row and picked positionally from each row.
+    """
+    with filepath.open('r', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        pick = itemgetter(*(header.index(name) for name in columns))
+        for row in reader:
+            # Blank lines come back as [] (DictReader skips them too)
+            if row:
+                yield pick(row)
+
+
+def load_variants_from_csv(
+    filepath: Union[str, Path],
+    use_pandas: bool = True
+) -> List['genome.Variant']:
     """
     Load variants from a CSV file.
 
@@ -150,29 +325,60 @@ def load_variants_from_csv(filepath: Union[str, Path]) -> List['genome.Variant']
 
     Args:
         filepath: Path to CSV file
+        use_pandas: Parse with pandas.read_csv (default); if False, use the
+                    standard library csv module
 
     Returns:
         List of genome.Variant objects
     """
-    variants = []
     filepath = Path(filepath)
 
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            variant = genome.Variant(
-                chromosome=row['chromosome'],
-                position=int(row['position']),
-                reference_bases=row['reference_bases'],
-                alternate_bases=row['alternate_bases']
+    if not use_pandas:
+        variants = [
+            genome.Variant(
+                chromosome=_intern(chromosome),
+                position=int(position),
+                reference_bases=_intern(reference_bases, max_len=1),
+                alternate_bases=_intern(alternate_bases, max_len=1)
+            )
+            for chromosome, position, reference_bases, alternate_bases in _iter_csv_columns(
+                filepath, ['chromosome', 'position', 'reference_bases', 'alternate_bases']
             )
-            variants.append(variant)
+        ]
+        logger.info(f"Loaded {len(variants)} variants from {filepath}")
+        return variants
+
+    df = pd.read_csv(
+        filepath,
+        dtype={
+            'chromosome': 'string',
+            'position': 'int64',
+            'reference_bases': 'string',
+            'alternate_bases': 'string',
+        },
+        # Keep empty fields (e.g. deleted alleles) as '' like csv.reader does,
+        # rather than turning them and 'NA'/'null' into missing values
+        keep_default_na=False,
+        engine='pyarrow' if _HAS_PYARROW else 'c'
+    )
+    variants = [
+        genome.Variant(
+            chromosome=_intern(row.chromosome),
+            position=row.position,
+            reference_bases=_intern(row.reference_bases, max_len=1),
+            alternate_bases=_intern(row.alternate_bases, max_len=1)
+        )
+        for row in df.itertuples(index=False)
+    ]
 
     logger.info(f"Loaded {len(variants)} variants from {filepath}")
     return variants
 
 
-def load_intervals_from_csv(filepath: Union[str, Path]) -> List['genome.Interval']:
+def load_intervals_from_csv(
+    filepath: Union[str, Path],
+    use_pandas: bool = True
+) -> List['genome.Interval']:
     """
     Load genomic intervals from a CSV file.
 
@@ -183,27 +389,95 @@ def load_intervals_from_csv(filepath: Union[str, Path]) -> List['genome.Interval
 
     Args:
         filepath: Path to CSV file
+        use_pandas: Parse with pandas.read_csv (default); if False, use the
+                    standard library csv module
 
     Returns:
         List of genome.Interval objects
     """
-    intervals = []
     filepath = Path(filepath)
 
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            interval = genome.Interval(
-                chromosome=row['chromosome'],
-                start=int(row['start']),
-                end=int(row['end'])
+    if not use_pandas:
+        intervals = [
+            genome.Interval(
+                chromosome=_intern(chromosome),
+                start=int(start),
+                end=int(end)
             )
-            intervals.append(interval)
+            for chromosome, start, end in _iter_csv_columns(filepath, ['chromosome', 'start', 'end'])
+        ]
+        logger.info(f"Loaded {len(intervals)} intervals from {filepath}")
+        return intervals
+
+    df = pd.read_csv(
+        filepath,
+        dtype={'chromosome': 'string', 'start': 'int64', 'end': 'int64'},
+        # Read strings as-is, like csv.reader does
+        keep_default_na=False,
+        engine='pyarrow' if _HAS_PYARROW else 'c'
+    )
+    intervals = [
+        genome.Interval(
+            chromosome=_intern(row.chromosome),
+            start=row.start,
+            end=row.end
+        )
+        for row in df.itertuples(index=False)
+    ]
 
     logger.info(f"Loaded {len(intervals)} intervals from {filepath}")
     return intervals
 
 
+def _run_batch(
+    predict_one,
+    n: int,
+    kind: str,
+    max_workers: int,
+    show_progress: bool,
+    monitor: bool,
+    recent_failures: deque
+) -> Iterator[tuple]:
+    """
+    Run `predict_one(i)` for every index in range(n) on a thread pool.
+
+    Yields `(i, result)` in input order, where `result[0]` is the success flag.
+    When iteration ends (including when the caller stops early, in which case
+    requests not yet started are cancelled) the batch summary is logged and
+    the API monitor is updated with the number of requests that actually ran,
+    whether or not the caller consumed their results.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = []
+    try:
+        # Requests are network-bound, so run them concurrently; results are
+        # read back in submission order to keep input order
+        futures = [executor.submit(predict_one, i) for i in range(n)]
+        ordered = futures
+        if show_progress and _HAS_TQDM:
+            ordered = tqdm(futures, total=n, desc=f"Predicting {kind}s")
+        for i, future in enumerate(ordered):
+            yield i, future.result()
+    finally:
+        # Waits for requests already running; the rest are cancelled
+        executor.shutdown(cancel_futures=True)
+
+        ran = [f for f in futures if not f.cancelled()]
+        n_done = len(ran)
+        n_success = sum(f.exception() is None and f.result()[0] for f in ran)
+
+        if n_done != n_success:
+            logger.warning(
+                f"{n_done - n_success} of {n_done} {kind} predictions failed; "
+                f"most recent errors: {list(recent_failures)}"
+            )
+        logger.info(f"Completed {n_done} {kind} predictions ({n_success} successful)")
+
+        # Update API monitor once per batch
+        if monitor and n_done:
+            monitor_api_quota().increment(count=n_done)
+
+
 def batch_predict_variants(
     variants: List['genome.Variant'],
     model,
@@ -212,8 +486,12 @@ def batch_predict_variants(
     ontology_terms: Optional[List[str]] = None,
     requested_outputs=None,
     show_progress: bool = True,
-    monitor: bool = True
-) -> pd.DataFrame:
+    monitor: bool = True,
+    max_workers: int = 16,
+    rate_limit: Optional[float] = None,
+    compact: bool = True,
+    return_format: Literal['dataframe', 'counts', 'iter'] = 'dataframe'
+) -> Union[pd.DataFrame, Dict[str, int], Iterator[_VariantResult]]:
     """
     Batch predict variant effects.
 
@@ -227,32 +505,58 @@ def batch_predict_variants(
         requested_outputs: List of output types (e.g., [dna_client.OutputType.RNA_SEQ])
         show_progress: Show progress bar if tqdm is available
         monitor: Track API usage with APIMonitor
+        max_workers: Number of concurrent prediction requests (default: 16)
+        rate_limit: Maximum number of requests per second (default: no limit)
+        compact: Store result columns in narrow dtypes (int32 coordinates,
+                 categorical chromosome/alleles) to reduce memory
+        return_format: 'dataframe' (default) for a DataFrame of results,
+                       'counts' for a {'success': ..., 'fail': ...} dict, or
+                       'iter' for an iterator of per-variant named tuples
+                       (chromosome, position, reference, alternate, success,
+                       has_outputs, error) yielded in input order
 
     Returns:
-        DataFrame with prediction results
+        DataFrame with prediction results (or counts/iterator, see return_format)
     """
     # Import genome module locally to avoid None reference
     from alphagenome.data import genome as genome_module
     from alphagenome.models import dna_client as client
-    
+
+    if return_format not in ('dataframe', 'counts', 'iter'):
+        raise ValueError(f"Unknown return_format: {return_format!r}")
+
     if requested_outputs is None:
         requested_outputs = [client.OutputType.RNA_SEQ]
 
     if ontology_terms is None:
         ontology_terms = []
 
-    results = []
-    iterator = tqdm(variants, desc="Predicting variants") if (show_progress and tqdm) else variants
+    n = len(variants)
+
+    # Individual failures are kept in the result; only the most recent few
+    # are remembered for the summary logged at the end of the batch
+    recent_failures = deque(maxlen=10)
+
+    # Window bounds around every variant are computed once, up front
+    positions = np.fromiter((v.position for v in variants), dtype=np.int64, count=n)
+    if interval is None:
+        half_window = window_size // 2
+        starts = np.maximum(0, positions - half_window).tolist()
+        ends = (positions + half_window).tolist()
 
-    for variant in iterator:
+    bucket = TokenBucket(rate_limit, burst=int(rate_limit)) if rate_limit else None
+
+    def _predict_one(i):
+        variant = variants[i]
+        if bucket is not None:
+            bucket.acquire()
         try:
-            # If interval not provided, create one around the variant
+            # If interval not provided, use the window around the variant
             if interval is None:
-                # Create window around variant with specified size
                 var_interval = genome_module.Interval(
                     chromosome=variant.chromosome,
-                    start=max(0, variant.position - window_size // 2),
-                    end=variant.position + window_size // 2
+                    start=starts[i],
+                    end=ends[i]
                 )
             else:
                 var_interval = interval
@@ -265,40 +569,64 @@ def batch_predict_variants(
                 requested_outputs=requested_outputs
             )
 
-            # Store results
-            result = {
-                'chromosome': variant.chromosome,
-                'position': variant.position,
-                'reference': variant.reference_bases,
-                'alternate': variant.alternate_bases,
-                'success': True,
-            }
-
-            # Add output-specific data
-            if hasattr(outputs, 'reference') and hasattr(outputs, 'alternate'):
-                result['has_outputs'] = True
-            else:
-                result['has_outputs'] = False
-
-            results.append(result)
-
-            # Update API monitor
-            if monitor:
-                monitor_api_quota().increment()
+            # Returns (success, has_outputs, error)
+            return True, hasattr(outputs, 'reference') and hasattr(outputs, 'alternate'), None
 
         except Exception as e:
-            logger.error(f"Error predicting variant {variant.chromosome}:{variant.position}: {e}")
-            results.append({
-                'chromosome': variant.chromosome,
-                'position': variant.position,
-                'reference': variant.reference_bases,
-                'alternate': variant.alternate_bases,
-                'success': False,
-                'error': str(e)
-            })
-
-    df = pd.DataFrame(results)
-    logger.info(f"Completed {len(df)} variant predictions ({df['success'].sum()} successful)")
+            recent_failures.append(f"{variant.chromosome}:{variant.position}: {e!r}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Error predicting variant {variant.chromosome}:{variant.position}: {e}")
+            return False, False, str(e)
+
+    rows = _run_batch(
+        _predict_one, n, 'variant', max_workers, show_progress, monitor, recent_failures
+    )
+
+    if return_format == 'iter':
+        return (
+            _VariantResult(
+                variants[i].chromosome,
+                variants[i].position,
+                variants[i].reference_bases,
+                variants[i].alternate_bases,
+                *result
+            )
+            for i, result in rows
+        )
+
+    if return_format == 'counts':
+        n_success = sum(result[0] for _, result in rows)
+        return {'success': n_success, 'fail': n - n_success}
+
+    # Results are collected column-wise into preallocated lists and the
+    # DataFrame is built once at the end
+    success = [False] * n
+    has_outputs = [False] * n
+    errors = [None] * n
+
+    for i, (ok, outputs_ok, error) in rows:
+        success[i] = ok
+        has_outputs[i] = outputs_ok
+        errors[i] = error
+
+    df = pd.DataFrame({
+        'chromosome': [v.chromosome for v in variants],
+        'position': positions,
+        'reference': [v.reference_bases for v in variants],
+        'alternate': [v.alternate_bases for v in variants],
+        'success': success,
+        'has_outputs': has_outputs,
+        'error': errors,
+    })
+
+    if compact:
+        # Positions fit in int32 for all known genomes (< 2.1 Gbp per chromosome)
+        df['position'] = df['position'].astype('int32')
+        df['chromosome'] = df['chromosome'].astype('category')
+        for column in ('reference', 'alternate'):
+            # Single-base alleles have only a handful of distinct values
+            if n and (df[column].str.len() == 1).all():
+                df[column] = df[column].astype('category')
 
     return df
 
@@ -309,8 +637,12 @@ def batch_predict_sequences(
     ontology_terms=None,
     requested_outputs=None,
     show_progress: bool = True,
-    monitor: bool = True
-) -> pd.DataFrame:
+    monitor: bool = True,
+    max_workers: int = 16,
+    rate_limit: Optional[float] = None,
+    compact: bool = True,
+    return_format: Literal['dataframe', 'counts', 'iter'] = 'dataframe'
+) -> Union[pd.DataFrame, Dict[str, int], Iterator[_SequenceResult]]:
     """
     Batch predict sequence features.
 
@@ -321,32 +653,45 @@ def batch_predict_sequences(
         requested_outputs: List of output types
         show_progress: Show progress bar
         monitor: Track API usage
+        max_workers: Number of concurrent prediction requests (default: 16)
+        rate_limit: Maximum number of requests per second (default: no limit)
+        compact: Store result columns in narrow dtypes (int32 coordinates,
+                 categorical chromosome) to reduce memory
+        return_format: 'dataframe' (default) for a DataFrame of results,
+                       'counts' for a {'success': ..., 'fail': ...} dict, or
+                       'iter' for an iterator of per-interval named tuples
+                       (chromosome, start, end, length, success, error,
+                       mean_expression, max_expression, data_points)
+                       yielded in input order
 
     Returns:
-        DataFrame with prediction results
+        DataFrame with prediction results (or counts/iterator, see return_format)
     """
     # Import here to avoid issues with module-level import failures
     from alphagenome.models import dna_client as dc
-    
+
+    if return_format not in ('dataframe', 'counts', 'iter'):
+        raise ValueError(f"Unknown return_format: {return_format!r}")
+
     if ontology_terms is None:
         ontology_terms = ['UBERON:0001157']  # Default tissue type
-    
+
     if requested_outputs is None:
         requested_outputs = [dc.OutputType.RNA_SEQ]
 
-    results = []
-    iterator = tqdm(intervals, desc="Predicting sequences") if (show_progress and tqdm) else intervals
-
-    for interval in iterator:
-        result = {
-            'chromosome': interval.chromosome,
-            'start': interval.start,
-            'end': interval.end,
-            'length': interval.end - interval.start,
-            'success': False,
-            'error': None
-        }
-        
+    n = len(intervals)
+
+    # Individual failures (errors and predictions without RNA-seq data) are
+    # kept in the result; only the most recent few are remembered for the
+    # summary logged at the end of the batch
+    recent_failures = deque(maxlen=10)
+
+    bucket = TokenBucket(rate_limit, burst=int(rate_limit)) if rate_limit else None
+
+    def _predict_one(i):
+        interval = intervals[i]
+        if bucket is not None:
+            bucket.acquire()
         try:
             outputs = model.predict_interval(
                 interval=interval,
@@ -360,28 +705,78 @@ def batch_predict_sequences(
                 rna_data = outputs.rna_seq  # This is TrackData
                 # TrackData has .values attribute which is the data array
                 if hasattr(rna_data, 'values'):
-                    result['mean_expression'] = float(rna_data.values.mean())
-                    result['max_expression'] = float(rna_data.values.max())
-                    result['data_points'] = len(rna_data.values)
-                    result['success'] = True
-                else:
-                    result['error'] = 'RNA-seq data has no values attribute'
+                    # Returns (success, error, mean_expression, max_expression, data_points)
+                    return (
+                        True,
+                        None,
+                        float(rna_data.values.mean()),
+                        float(rna_data.values.max()),
+                        len(rna_data.values)
+                    )
+                error = 'RNA-seq data has no values attribute'
             else:
-                result['error'] = 'No RNA-seq data returned'
-
-            results.append(result)
-
-            if monitor:
-                monitor_api_quota().increment()
+                error = 'No RNA-seq data returned'
+            recent_failures.append(f"{interval.chromosome}:{interval.start}-{interval.end}: {error}")
+            return False, error, None, None, None
 
         except Exception as e:
-            logger.error(f"Error predicting interval {interval.chromosome}:{interval.start}-{interval.end}: {e}")
-            result['error'] = str(e)
-            results.append(result)
-
-
-    df = pd.DataFrame(results)
-    logger.info(f"Completed {len(df)} sequence predictions ({df['success'].sum()} successful)")
+            recent_failures.append(f"{interval.chromosome}:{interval.start}-{interval.end}: {e!r}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Error predicting interval {interval.chromosome}:{interval.start}-{interval.end}: {e}")
+            return False, str(e), None, None, None
+
+    rows = _run_batch(
+        _predict_one, n, 'sequence', max_workers, show_progress, monitor, recent_failures
+    )
+
+    if return_format == 'iter':
+        return (
+            _SequenceResult(
+                intervals[i].chromosome,
+                intervals[i].start,
+                intervals[i].end,
+                intervals[i].end - intervals[i].start,
+                *result
+            )
+            for i, result in rows
+        )
+
+    if return_format == 'counts':
+        n_success = sum(result[0] for _, result in rows)
+        return {'success': n_success, 'fail': n - n_success}
+
+    # Results are collected column-wise into preallocated lists and the
+    # DataFrame is built once at the end
+    success = [False] * n
+    errors = [None] * n
+    mean_expression = [float('nan')] * n
+    max_expression = [float('nan')] * n
+    data_points = [None] * n
+
+    for i, (ok, error, mean_expr, max_expr, points) in rows:
+        success[i] = ok
+        errors[i] = error
+        if ok:
+            mean_expression[i] = mean_expr
+            max_expression[i] = max_expr
+            data_points[i] = points
+
+    df = pd.DataFrame({
+        'chromosome': [iv.chromosome for iv in intervals],
+        'start': [iv.start for iv in intervals],
+        'end': [iv.end for iv in intervals],
+        'length': [iv.end - iv.start for iv in intervals],
+        'success': success,
+        'error': errors,
+        'mean_expression': mean_expression,
+        'max_expression': max_expression,
+        'data_points': data_points,
+    })
+
+    if compact:
+        # Coordinates fit in int32 for all known genomes (< 2.1 Gbp per chromosome)
+        df[['start', 'end', 'length']] = df[['start', 'end', 'length']].astype('int32')
+        df['chromosome'] = df['chromosome'].astype('category')
 
     return df
 
@@ -450,7 +845,6 @@ def save_results(
         export_to_excel(outputs, result_dir / f'{prefix}.xlsx')
 
     if 'json' in formats:
-        import json
         with open(result_dir / f'{prefix}.json', 'w') as f:
             # TODO: Convert outputs to JSON-serializable format
             json.dump({}, f)
@@ -470,13 +864,19 @@ def export_to_csv(data, filepath: Union[str, Path]):
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    if isinstance(data, pd.DataFrame):
-        data.to_csv(filepath, index=False)
-    elif isinstance(data, dict):
-        pd.DataFrame(data).to_csv(filepath, index=False)
-    else:
+    if not isinstance(data, pd.DataFrame):
         # Try to convert to DataFrame
-        pd.DataFrame(data).to_csv(filepath, index=False)
+        data = pd.DataFrame(data)
+
+    if _HAS_PYARROW:
+        try:
+            table = pyarrow.Table.from_pandas(data, preserve_index=False)
+            pyarrow.csv.write_csv(table, str(filepath))
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, pyarrow.ArrowNotImplementedError):
+            # Columns pyarrow cannot convert (e.g. mixed-type objects)
+            data.to_csv(filepath, index=False)
+    else:
+        data.to_csv(filepath, index=False)
 
     logger.info(f"Exported to CSV: {filepath}")
 
@@ -494,12 +894,12 @@ def export_to_excel(data, filepath: Union[str, Path], sheet_name: str = 'Results
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
     if isinstance(data, pd.DataFrame):
-        data.to_excel(filepath, sheet_name=sheet_name, index=False)
+        data.to_excel(filepath, sheet_name=sheet_name, index=False, engine=_EXCEL_ENGINE)
     elif isinstance(data, dict):
-        with pd.ExcelWriter(filepath) as writer:
+        with pd.ExcelWriter(filepath, engine=_EXCEL_ENGINE) as writer:
             for key, value in data.items():
                 pd.DataFrame(value).to_excel(writer, sheet_name=str(key), index=False)
     else:
-        pd.DataFrame(data).to_excel(filepath, sheet_name=sheet_name, index=False)
+        pd.DataFrame(data).to_excel(filepath, sheet_name=sheet_name, index=False, engine=_EXCEL_ENGINE)
 
     logger.info(f"Exported to Excel: {filepath}")
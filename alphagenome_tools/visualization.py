@@ -10,22 +10,10 @@ from pathlib import Path
 from typing import List, Optional, Union
 import numpy as np
 
-# Visualization imports
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as mpatches
-    import seaborn as sns
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    print("Warning: matplotlib/seaborn not installed. Install with: pip install matplotlib seaborn")
-
 # AlphaGenome imports
 try:
-    from alphagenome.visualization import plot_components
     from alphagenome.data import genome
 except ImportError:
-    plot_components = None
     genome = None
 
 # Pandas
@@ -37,12 +25,40 @@ except ImportError:
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Set default style
-if MATPLOTLIB_AVAILABLE:
+# matplotlib/seaborn are imported on first use rather than at module import,
+# so importing alphagenome_tools stays fast when no plots are made
+_STYLE_APPLIED = False
+
+
+def _apply_style(plt):
+    """Set the default plot style (once per process)."""
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+
+    import seaborn as sns
+
     sns.set_style('whitegrid')
     plt.rcParams['figure.dpi'] = 100
     plt.rcParams['savefig.dpi'] = 300
     plt.rcParams['font.size'] = 10
+    _STYLE_APPLIED = True
+
+
+def _import_pyplot():
+    """
+    Import matplotlib.pyplot and apply the default style.
+
+    Returns:
+        The matplotlib.pyplot module, or None if matplotlib/seaborn are not installed
+    """
+    try:
+        import matplotlib.pyplot as plt
+        _apply_style(plt)
+    except ImportError:
+        logger.error("matplotlib/seaborn not available. Install with: pip install matplotlib seaborn")
+        return None
+    return plt
 
 
 def quick_plot(outputs, figsize=(12, 6), save_path: Optional[Path] = None):
@@ -59,8 +75,8 @@ def quick_plot(outputs, figsize=(12, 6), save_path: Optional[Path] = None):
     Returns:
         matplotlib Figure object
     """
-    if not MATPLOTLIB_AVAILABLE:
-        logger.error("matplotlib not available")
+    plt = _import_pyplot()
+    if plt is None:
         return None
 
     fig, ax = plt.subplots(figsize=figsize)
@@ -129,8 +145,8 @@ def plot_variant_comparison(
     Returns:
         matplotlib Figure object
     """
-    if not MATPLOTLIB_AVAILABLE:
-        logger.error("matplotlib not available")
+    plt = _import_pyplot()
+    if plt is None:
         return None
 
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
@@ -232,8 +248,8 @@ def plot_batch_summary(
     Returns:
         matplotlib Figure object
     """
-    if not MATPLOTLIB_AVAILABLE:
-        logger.error("matplotlib not available")
+    plt = _import_pyplot()
+    if plt is None:
         return None
 
     if pd is None:
@@ -290,7 +306,9 @@ def plot_expression_heatmap(
     Create a heatmap visualization of gene expression predictions.
 
     Args:
-        data: Expression data (2D array or DataFrame)
+        data: Expression data (2D array or DataFrame). Arrays are used
+              without copying where possible, so the plotted image may
+              share memory with the caller's data.
         figsize: Figure size (width, height)
         cmap: Colormap name
         save_path: Optional path to save the figure
@@ -299,8 +317,8 @@ def plot_expression_heatmap(
     Returns:
         matplotlib Figure object
     """
-    if not MATPLOTLIB_AVAILABLE:
-        logger.error("matplotlib not available")
+    plt = _import_pyplot()
+    if plt is None:
         return None
 
     fig, ax = plt.subplots(figsize=figsize)
@@ -308,8 +326,12 @@ def plot_expression_heatmap(
     # Convert to numpy array if needed
     if hasattr(data, 'values'):
         data = data.values
-    elif not isinstance(data, np.ndarray):
-        data = np.array(data)
+    else:
+        data = np.asarray(data)
+
+    # float32 is plenty for display; halve the memory of large matrices
+    if data.dtype == np.float64 and data.size > 1_000_000:
+        data = data.astype(np.float32, copy=False)
 
     # Create heatmap
     im = ax.imshow(data, cmap=cmap, aspect='auto')
@@ -354,27 +376,39 @@ def plot_tracks_overlaid(
     Returns:
         matplotlib Figure object
     """
-    if not MATPLOTLIB_AVAILABLE:
-        logger.error("matplotlib not available")
+    plt = _import_pyplot()
+    if plt is None:
         return None
 
     fig, ax = plt.subplots(figsize=figsize)
 
-    # Plot each track
-    for track_name, track_data in tracks_data.items():
-        # Convert to numpy array if needed
+    # Convert each track to a numpy array if needed
+    track_names = list(tracks_data)
+    track_arrays = []
+    for track_data in tracks_data.values():
         if hasattr(track_data, 'values'):
-            y_data = track_data.values
+            track_arrays.append(track_data.values)
         elif isinstance(track_data, list):
-            y_data = np.array(track_data)
+            track_arrays.append(np.array(track_data))
         else:
-            y_data = track_data
+            track_arrays.append(track_data)
 
-        # Create x-axis (genomic position)
-        x_data = np.linspace(interval.start, interval.end, len(y_data))
+    lengths = {len(y_data) for y_data in track_arrays}
 
-        # Plot track
-        ax.plot(x_data, y_data, label=track_name, linewidth=1.5)
+    if len(lengths) == 1 and all(np.ndim(y_data) == 1 for y_data in track_arrays):
+        # All tracks share one x-axis (genomic position): build it once and
+        # plot the tracks as columns of a single array
+        x_data = np.linspace(interval.start, interval.end, lengths.pop())
+        lines = ax.plot(x_data, np.column_stack(track_arrays), linewidth=1.5)
+        for line, track_name in zip(lines, track_names):
+            line.set_label(track_name)
+    else:
+        # Reuse the x-axis between tracks of the same length
+        x_by_length = {}
+        for track_name, y_data in zip(track_names, track_arrays):
+            if len(y_data) not in x_by_length:
+                x_by_length[len(y_data)] = np.linspace(interval.start, interval.end, len(y_data))
+            ax.plot(x_by_length[len(y_data)], y_data, label=track_name, linewidth=1.5)
 
     # Add legend
     ax.legend(loc='best')
@@ -424,8 +458,8 @@ def create_multi_panel_figure(
     Returns:
         matplotlib Figure object
     """
-    if not MATPLOTLIB_AVAILABLE:
-        logger.error("matplotlib not available")
+    plt = _import_pyplot()
+    if plt is None:
         return None
 
     n_panels = len(outputs_list)
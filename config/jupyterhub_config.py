@@ -5,6 +5,26 @@ Multi-user setup with simple authentication for 2-5 users
 
 import os
 import sys
+import time
+import queue
+import atexit
+import asyncio
+import shutil
+import binascii
+import sqlite3
+import hashlib
+import logging
+import logging.handlers
+from collections import OrderedDict
+from types import MappingProxyType
+
+# Admin users and login-page template variables, built once as read-only
+# values. The traitlets need a real set/dict, so each gets a single copy below
+_ADMINS = frozenset(('admin',))
+_TEMPLATE_VARS = MappingProxyType({
+    'prefix': 'AlphaGenome',
+    'organization': 'Company R&D',
+})
 
 # =============================================================================
 # Basic Configuration
@@ -25,48 +45,107 @@ c.JupyterHub.bind_url = 'http://0.0.0.0:8000'
 # =============================================================================
 
 from jupyterhub.auth import Authenticator
-
-# Create a simple password-based authentication
-class DictionaryAuthenticator(Authenticator):
-    """
-    Simple dictionary-based authenticator for small teams.
-    Users and passwords are defined below.
-    """
-
-    # Define users and passwords here
-    # Format: 'username': 'password'
-    users = {
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+
+# Argon2 password hasher (default parameters)
+_ph = PasswordHasher()
+
+# Define users and passwords here
+# Format: 'username': 'password'
+# Passwords are hashed with Argon2 once when the config is loaded; only the
+# hashes are kept, in a read-only mapping
+_USER_HASHES = MappingProxyType({
+    username: _ph.hash(password)
+    for username, password in {
         'admin': 'admin123',      # Administrator
         'user1': 'user123',       # Team member 1
         'user2': 'user123',       # Team member 2
         'user3': 'user123',       # Team member 3
         'user4': 'user123',       # Team member 4
         'user5': 'user123',       # Team member 5
-    }
+    }.items()
+})
+
+# Hash checked for unknown usernames, so they take as long to reject as a
+# wrong password for a real user
+_DUMMY_HASH = _ph.hash(os.urandom(16).hex())
+
+# Cache of recently verified logins, so repeat logins skip the Argon2 check.
+# Keys are (username, keyed BLAKE2b digest of the password); the digest key is
+# random per Hub process, so raw passwords are never stored.
+_VERIFY_CACHE_TTL = 300      # seconds
+_VERIFY_CACHE_SIZE = 128
+_verify_cache_secret = os.urandom(32)
+_verify_cache = OrderedDict()
+
+# Create a simple password-based authentication
+class DictionaryAuthenticator(Authenticator):
+    """
+    Simple dictionary-based authenticator for small teams.
+    Users and passwords are defined in _USER_HASHES above.
+    """
 
     async def authenticate(self, handler, data):
         """Authenticate user with username and password"""
         username = data['username']
         password = data['password']
 
-        if username in self.users and self.users[username] == password:
+        password_hash = _USER_HASHES.get(username)
+        if password_hash is None:
+            # Pay the same Argon2 cost as a known user, so response time
+            # doesn't reveal which usernames exist
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, _ph.verify, _DUMMY_HASH, password
+                )
+            except VerifyMismatchError:
+                pass
+            return None
+
+        cache_key = (
+            username,
+            hashlib.blake2b(password.encode(), key=_verify_cache_secret, digest_size=16).digest(),
+        )
+        verified_at = _verify_cache.get(cache_key)
+        if verified_at is not None and time.monotonic() - verified_at < _VERIFY_CACHE_TTL:
+            _verify_cache.move_to_end(cache_key)
             return username
-        return None
+
+        try:
+            # Argon2 verification is CPU-bound; run it off the Hub's event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, _ph.verify, password_hash, password
+            )
+        except VerifyMismatchError:
+            return None
+
+        _verify_cache[cache_key] = time.monotonic()
+        _verify_cache.move_to_end(cache_key)
+        if len(_verify_cache) > _VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+        return username
 
 # Use our custom authenticator
 c.JupyterHub.authenticator_class = DictionaryAuthenticator
 
 # Set admin users (these users can admin the JupyterHub server)
-c.JupyterHub.admin_users = {
-    'admin',
-}
+c.JupyterHub.admin_users = set(_ADMINS)
 
 # =============================================================================
 # Spawner Configuration
 # =============================================================================
 
-# Use LocalProcessSpawner (runs servers as local processes)
-c.JupyterHub.spawner_class = 'jupyterhub.spawner.LocalProcessSpawner'
+# Use SystemdSpawner where systemd is running, so mem_limit/cpu_limit are
+# enforced by cgroups (LocalProcessSpawner ignores them). Inside the Docker
+# image there is no systemd, so fall back to LocalProcessSpawner there and
+# rely on the container's own limits in docker-compose.yml
+if os.path.isdir('/run/systemd/system'):
+    c.JupyterHub.spawner_class = 'systemdspawner.SystemdSpawner'
+    c.SystemdSpawner.isolate_tmp = True
+    c.SystemdSpawner.dynamic_users = False
+else:
+    c.JupyterHub.spawner_class = 'jupyterhub.spawner.LocalProcessSpawner'
 
 # Set default URL for user servers (opens JupyterLab by default)
 c.Spawner.default_url = '/lab'
@@ -74,41 +153,78 @@ c.Spawner.default_url = '/lab'
 # Set the working directory for user notebooks
 c.Spawner.notebook_dir = '~/work'
 
-# Environment variables to pass to user notebooks
-c.Spawner.environment = {
+# Paths passed to user notebooks
+SHARED_DATA_PATH = '/shared/data'
+SHARED_TOOLS_PATH = '/shared/tools'
+
+# Environment variables to pass to user notebooks. Built once as a read-only
+# mapping; the traitlet itself needs a plain dict, so it gets a single copy.
+# No PYTHONPATH: alphagenome_tools is importable through a .pth file in the image
+_SPAWNER_ENV = MappingProxyType({
     'ALPHAGENOME_API_KEY': os.environ.get('ALPHAGENOME_API_KEY', ''),
-    'SHARED_DATA_PATH': '/shared/data',
-    'SHARED_TOOLS_PATH': '/shared/tools',
-    'PYTHONPATH': '/opt/alphagenome_packages:/usr/lib/python3/dist-packages',
-}
+    'SHARED_DATA_PATH': SHARED_DATA_PATH,
+    'SHARED_TOOLS_PATH': SHARED_TOOLS_PATH,
+})
+c.Spawner.environment = dict(_SPAWNER_ENV)
 
-# Resource limits for each user container
+# Resource limits for each user server (enforced by SystemdSpawner)
 c.Spawner.mem_limit = '2G'
 c.Spawner.cpu_limit = 1.0
 
-# Automatically start user servers when they log in
-c.Spawner.start_timeout = 300
+# Give up on a user server that has not started within a minute
+c.Spawner.start_timeout = 60
 
 # =============================================================================
 # User Server Configuration
 # =============================================================================
 
-# Set default working directory for all users
-c.Spawner.notebook_dir = '~/work'
+# Subdirectories created under each user's ~/work
+USER_SUBDIRS = ('notebooks', 'results', 'data', 'figures', 'exports')
 
-# Create user directories on first spawn
-def make_userdir(spawner):
-    """Create user home directory structure on first spawn"""
-    import os
-    import subprocess
+# Users whose directory structure this Hub process has already set up
+_initialized_users = set()
+
+# Home directories that exist when the Hub starts (listed once, not per spawn)
+try:
+    _HOME_DIRS = frozenset(os.listdir('/home'))
+except FileNotFoundError:
+    _HOME_DIRS = frozenset()
 
-    user = spawner.user.name
-    home_dir = f'/home/{user}' if os.path.exists(f'/home/{user}') else f'/tmp/{user}'
+def _make_userdir_sync(user):
+    """Create the directory structure for `user` (blocking filesystem calls)"""
+    if user in _initialized_users:
+        return
 
-    # Create work directory structure
+    home_dir = f'/home/{user}'
+    if user not in _HOME_DIRS:
+        # Not present at Hub startup; check in case it has been created since
+        try:
+            os.stat(home_dir)
+        except FileNotFoundError:
+            home_dir = f'/tmp/{user}'
+
+    # Create work directory structure, unless it already exists
     work_dir = os.path.join(home_dir, 'work')
-    for subdir in ['notebooks', 'results', 'data', 'figures', 'exports']:
-        os.makedirs(os.path.join(work_dir, subdir), exist_ok=True)
+    try:
+        os.stat(work_dir)
+    except FileNotFoundError:
+        # Create the shared prefix once, then only the leaf directories
+        os.makedirs(work_dir, exist_ok=True)
+        for subdir in USER_SUBDIRS:
+            try:
+                os.mkdir(os.path.join(work_dir, subdir))
+            except FileExistsError:
+                pass
+
+    _initialized_users.add(user)
+
+# Create user directories on first spawn
+async def make_userdir(spawner):
+    """Create user home directory structure on first spawn"""
+    # Filesystem calls can block (e.g. on NFS); keep them off the Hub's event loop
+    await asyncio.get_running_loop().run_in_executor(
+        None, _make_userdir_sync, spawner.user.name
+    )
 
 # Hook to create directories before spawn
 c.Spawner.pre_spawn_hook = make_userdir
@@ -117,23 +233,78 @@ c.Spawner.pre_spawn_hook = make_userdir
 # Services
 # =============================================================================
 
-# You can add services here if needed
-# c.JupyterHub.services = [
-#     {
-#         'name': 'cull-idle',
-#         'admin': True,
-#         'command': [sys.executable, '-m', 'jupyterhub_idle_culler',
-#                    '--timeout=3600'],
-#     }
-# ]
+# Stop user servers idle for 30 minutes (and remove their idle users), so
+# memory is bounded by active users rather than everyone who has logged in
+c.JupyterHub.load_roles = [
+    {
+        'name': 'jupyterhub-idle-culler-role',
+        'scopes': [
+            'list:users',
+            'read:users:activity',
+            'read:servers',
+            'delete:servers',
+            'admin:users',
+        ],
+        'services': ['cull-idle'],
+    }
+]
+
+c.JupyterHub.services = [
+    {
+        'name': 'cull-idle',
+        'command': [sys.executable, '-m', 'jupyterhub_idle_culler',
+                    '--timeout=1800', '--cull-users'],
+    }
+]
+
+# =============================================================================
+# Database
+# =============================================================================
+
+# Keep the Hub database on tmpfs (RAM), so commits on the login path never
+# wait for a disk fsync. It is restored from disk when the Hub starts and
+# saved back when the Hub shuts down.
+_DB_PATH = '/dev/shm/jupyterhub.sqlite'
+_DB_BACKUP_PATH = '/srv/jupyterhub/jupyterhub.sqlite'
+
+if not os.path.exists(_DB_PATH) and os.path.exists(_DB_BACKUP_PATH):
+    shutil.copyfile(_DB_BACKUP_PATH, _DB_PATH)
+
+c.JupyterHub.db_url = f'sqlite:///{_DB_PATH}'
+
+def _save_db():
+    """Copy the tmpfs database back to disk on Hub exit"""
+    if not os.path.exists(_DB_PATH):
+        return
+    tmp_path = f'{_DB_BACKUP_PATH}.tmp'
+    try:
+        # VACUUM INTO refuses to overwrite an existing file
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        conn = sqlite3.connect(_DB_PATH)
+        try:
+            conn.execute('VACUUM INTO ?', (tmp_path,))
+        finally:
+            conn.close()
+        os.replace(tmp_path, _DB_BACKUP_PATH)
+    except (OSError, sqlite3.Error) as e:
+        logging.getLogger('JupyterHub').error(f"Could not save Hub database to {_DB_BACKUP_PATH}: {e}")
+
+# _save_db is registered with atexit in the Logging section, after the log
+# listener, so that a failed save can still reach the log file
 
 # =============================================================================
 # Security
 # =============================================================================
 
-# Generate a secure cookie secret (auto-generated on first run)
-# For production, set this explicitly in environment variable
-c.JupyterHub.cookie_secret_file = '/srv/jupyterhub/jupyterhub_cookie_secret'
+# Cookie secret: taken from JUPYTERHUB_COOKIE_SECRET (hex, e.g. the output of
+# `openssl rand -hex 32`) when set, so the Hub never touches a secret file.
+# Otherwise one is auto-generated into a file on tmpfs; that secret does not
+# survive a container restart, so users have to log in again afterwards
+_COOKIE_SECRET = os.environ.get('JUPYTERHUB_COOKIE_SECRET')
+if _COOKIE_SECRET:
+    c.JupyterHub.cookie_secret = binascii.unhexlify(_COOKIE_SECRET)
+c.JupyterHub.cookie_secret_file = '/dev/shm/jupyterhub_cookie_secret'
 
 # Allow self-signed certificates for internal deployments
 c.JupyterHub.ssl_enabled = False
@@ -143,10 +314,26 @@ c.JupyterHub.ssl_enabled = False
 # =============================================================================
 
 # Log level
-c.JupyterHub.log_level = 'INFO'
-
-# Log to file
-c.JupyterHub.extra_log_file = '/var/log/jupyterhub.log'
+_LOG_LEVEL = 'WARNING'
+c.JupyterHub.log_level = _LOG_LEVEL
+
+# Log to file. The Hub puts records on a queue and a background thread writes
+# them to the file, so disk I/O never blocks the event loop. Records are
+# formatted (with the Hub's own log format) by the queue handler, so the file
+# handler keeps the default formatter and writes the message as is
+_log_queue = queue.SimpleQueue()
+_log_file_handler = logging.FileHandler('/var/log/jupyterhub.log')
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setLevel(_LOG_LEVEL)
+c.JupyterHub.extra_log_handlers = [_log_queue_handler]
+
+# atexit runs handlers last-in, first-out: registering the database save after
+# the listener makes it run before the listener stops
+atexit.register(_save_db)
 
 # =============================================================================
 # Custom Configuration
@@ -156,17 +343,14 @@ c.JupyterHub.extra_log_file = '/var/log/jupyterhub.log'
 # c.JupyterHub.logo_file = '/shared/logo.png'
 
 # Custom template variables (optional)
-c.JupyterHub.template_vars = {
-    'prefix': 'AlphaGenome',
-    'organization': 'Company R&D',
-}
+c.JupyterHub.template_vars = dict(_TEMPLATE_VARS)
 
 # =============================================================================
 # Performance tuning
 # =============================================================================
 
-# Clean up servers after logout (optional)
-c.JupyterHub.cleanup_servers = False
+# Stop user servers when the Hub shuts down
+c.JupyterHub.cleanup_servers = True
 
 # Cleanup proxy on exit
 c.JupyterHub.cleanup_proxy = True
@@ -178,10 +362,7 @@ c.Spawner.active_server_limit = 5
 # User Management
 # =============================================================================
 
-# Admin users can manage the JupyterHub server
-c.JupyterHub.admin_users = {
-    'admin',
-}
+# Admin users are set once, in the Authentication section above
 
 # Disable user self-registration (users must be in the dictionary)
-# Only users defined in DictionaryAuthenticator.users can log in
+# Only users defined in _USER_HASHES can log in
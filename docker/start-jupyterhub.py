@@ -0,0 +1,22 @@
+"""
+Start JupyterHub on uvloop's event loop
+
+The event loop policy has to be installed before JupyterHub creates its
+event loop, which happens before jupyterhub_config.py is loaded, so it
+cannot be done from the config file. Falls back to the default asyncio
+loop if uvloop is not installed.
+"""
+
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from jupyterhub.app import main
+
+if __name__ == '__main__':
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    main()